@@ -6,100 +6,172 @@ transcription, OCR, and summarization pipeline.
 
 import logging
 import os
+import re
+from typing import Optional
 
+import orjson
 from flask import Flask, jsonify, send_from_directory
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from flask_session import Session
 
-from config.settings import Settings
+from config.settings import Settings, get_settings
+from utils.async_runner import run_async
+from utils.db import ensure_connected
 from utils.redis_client import get_redis_client
 from endpoints.auth import auth_bp
 from endpoints.database import database_bp
 from endpoints.health import health_bp
 
-# Initialize Flask application
-# Set static folder to serve frontend build files (relative to backend/)
-app = Flask(__name__, static_folder="../frontend/build", static_url_path="")
-
-# Load configuration
-settings = Settings()
-app.config["SECRET_KEY"] = settings.FLASK_SECRET_KEY
-
-# Enable CORS for development (frontend dev server runs on different port)
-CORS(
-    app,
-    supports_credentials=True,
-    origins=[
-        "http://localhost:3000",
-        "http://localhost:5173",
-        "http://127.0.0.1:3000",
-        "http://127.0.0.1:5173",
-    ],
-)
-
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
-# Initialize Redis client for OAuth state storage
-# Falls back to in-memory storage if Redis is unavailable
-redis_client = get_redis_client()
-logger.info(
-    "OAuth state storage initialized (Redis available: %s)", redis_client.is_available()
-)
-
-# Register blueprints
-app.register_blueprint(health_bp)
-app.register_blueprint(auth_bp)
-app.register_blueprint(database_bp)
-
-
-@app.route("/")
-def serve_frontend():
-    """Serve the React frontend"""
-    frontend_build = os.path.join(app.static_folder or "", "index.html")
-    if os.path.exists(frontend_build):
-        return send_from_directory(app.static_folder or "", "index.html")
-    else:
-        return jsonify(
-            {
-                "message": "Frontend not built yet",
-                "instructions": "Run 'cd frontend && npm install && npm run build' to build the frontend",
-            }
-        ), 404
-
 
-@app.route("/<path:path>")
-def serve_static(path):
-    """Serve static files or fallback to index.html for client-side routing"""
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson, used for all jsonify/get_json calls."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+def create_app(settings: Optional[Settings] = None) -> Flask:
+    """
+    Application factory: build and configure the Flask app.
+
+    Args:
+        settings: Optional pre-built Settings (tests can inject their own)
+
+    Returns:
+        Configured Flask application
+    """
+    # Set static folder to serve frontend build files (relative to backend/)
+    app = Flask(__name__, static_folder="../frontend/build", static_url_path="")
+
+    # orjson serializes nested dicts (e.g. Notion schema payloads) several
+    # times faster than the stdlib json provider
+    app.json = OrjsonProvider(app)
+
+    # Load configuration; validation runs once here rather than at import
+    # so a partially-configured dev environment can still boot
+    settings = settings or get_settings()
+    try:
+        settings.validate()
+    except ValueError as e:
+        logger.warning("Configuration incomplete: %s", e)
+    app.config["SECRET_KEY"] = settings.FLASK_SECRET_KEY
+
+    # Enable CORS for development (frontend dev server runs on different port)
+    # A single compiled regex replaces the linear scan over the origin list
+    # that flask-cors would otherwise run on every request
+    CORS(
+        app,
+        supports_credentials=True,
+        origins=re.compile(r"^http://(localhost|127\.0\.0\.1):(3000|5173)$"),
+    )
+
+    # Configure logging
+    logging.basicConfig(
+        level=getattr(logging, settings.LOG_LEVEL),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    # Initialize Redis client for OAuth state storage
+    # Falls back to in-memory storage if Redis is unavailable
+    redis_client = get_redis_client()
+    logger.info(
+        "OAuth state storage initialized (Redis available: %s)",
+        redis_client.is_available(),
+    )
+
+    # Server-side sessions in Redis: the cookie shrinks to an opaque id and
+    # requests skip per-request HMAC verification of a payload cookie.
+    # Without Redis we keep Flask's default signed cookie sessions.
+    if redis_client.is_available():
+        # flask-session stores pickled bytes, so it gets the bytes-mode
+        # connection; the decode_responses client would crash reading them
+        app.config.update(
+            SESSION_TYPE="redis",
+            SESSION_REDIS=redis_client.raw_connection,
+            SESSION_PERMANENT=False,
+            SESSION_USE_SIGNER=True,
+        )
+        Session(app)
+
+    # Register blueprints
+    app.register_blueprint(health_bp)
+    app.register_blueprint(auth_bp)
+    app.register_blueprint(database_bp)
+
+    # Pre-warm the Prisma connection on the background loop so the first
+    # request does not pay the engine startup cost. Failure is non-fatal:
+    # requests fall back to connecting lazily via ensure_connected()
+    try:
+        run_async(ensure_connected(), timeout=10)
+        logger.info("Database connection pre-warmed")
+    except Exception as e:
+        logger.warning("Could not pre-warm database connection: %s", e)
+
+    # Frontend assets are content-hashed by Vite, so let browsers cache them
+    # aggressively; index.html is the exception (max_age=0 below), since it
+    # must be revalidated to pick up new bundle hashes after a redeploy
+    app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 31536000
+
+    # Stat the build directory once at startup instead of on every request
     frontend_build = app.static_folder or ""
-    file_path = os.path.join(frontend_build, path)
+    has_build = os.path.isfile(os.path.join(frontend_build, "index.html"))
+
+    @app.route("/")
+    def serve_frontend():
+        """Serve the React frontend"""
+        if has_build:
+            return send_from_directory(frontend_build, "index.html", max_age=0)
+        else:
+            return jsonify(
+                {
+                    "message": "Frontend not built yet",
+                    "instructions": "Run 'cd frontend && npm install && npm run build' to build the frontend",
+                }
+            ), 404
+
+    @app.route("/<path:path>")
+    def serve_static(path):
+        """Serve static files or fallback to index.html for client-side routing"""
+        file_path = os.path.join(frontend_build, path)
+
+        if os.path.isfile(file_path):
+            return send_from_directory(frontend_build, path)
+        elif has_build:
+            # Fallback to index.html for client-side routing
+            return send_from_directory(frontend_build, "index.html", max_age=0)
+        return jsonify({"error": "Not found"}), 404
 
-    if os.path.exists(file_path) and os.path.isfile(file_path):
-        return send_from_directory(frontend_build, path)
-    else:
-        # Fallback to index.html for client-side routing
-        index_path = os.path.join(frontend_build, "index.html")
-        if os.path.exists(index_path):
-            return send_from_directory(frontend_build, "index.html")
+    @app.errorhandler(404)
+    def not_found(_error):
+        """Handle 404 errors for API routes"""
         return jsonify({"error": "Not found"}), 404
 
+    @app.errorhandler(500)
+    def internal_error(error):
+        """Handle 500 errors"""
+        logger.error("Internal server error: %s", error)
+        return jsonify({"error": "Internal server error"}), 500
 
-@app.errorhandler(404)
-def not_found(_error):
-    """Handle 404 errors for API routes"""
-    return jsonify({"error": "Not found"}), 404
+    return app
 
 
-@app.errorhandler(500)
-def internal_error(error):
-    """Handle 500 errors"""
-    logger.error("Internal server error: %s", error)
-    return jsonify({"error": "Internal server error"}), 500
+# WSGI entry point (also what asgi.py wraps and the tests import)
+app = create_app()
 
 
 if __name__ == "__main__":
-    # Run Flask development server
-    app.run(host="0.0.0.0", port=8080, debug=(settings.FLASK_ENV == "development"))
+    # The single-threaded Werkzeug server is for development only;
+    # production runs under gunicorn (see gunicorn.conf.py) or hypercorn
+    if get_settings().FLASK_ENV == "development":
+        app.run(host="0.0.0.0", port=8080, debug=True)
+    else:
+        raise SystemExit(
+            "Refusing to start the Flask dev server outside development; "
+            "use 'gunicorn -c gunicorn.conf.py app:app' instead"
+        )
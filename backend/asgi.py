@@ -0,0 +1,17 @@
+"""
+ASGI entrypoint for running the Flask app under an async server.
+
+Usage:
+    hypercorn asgi:asgi_app --workers 2 -b 0.0.0.0:8080
+
+The WSGI app is wrapped so request handling happens on a thread pool while
+the server's event loop keeps accepting connections, giving per-worker I/O
+concurrency without converting every view to async def (views bridge to the
+shared background loop in utils/async_runner.py for Prisma work).
+"""
+
+from asgiref.wsgi import WsgiToAsgi
+
+from app import app
+
+asgi_app = WsgiToAsgi(app)
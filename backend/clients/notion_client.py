@@ -3,12 +3,43 @@ Notion API Client Wrapper
 Provides methods for OAuth authentication and database operations.
 """
 
+import asyncio
 import logging
-from typing import List, Dict, Optional, Any
+from collections import OrderedDict
+from typing import AsyncIterator, List, Dict, Optional, Any
+
+import httpx
+import orjson
 from notion_client import Client, APIResponseError
 
+from utils.redis_client import get_redis_client
+
 logger = logging.getLogger(__name__)
 
+_API_BASE = "https://api.notion.com/v1"
+_NOTION_VERSION = "2022-06-28"
+
+# Search filter selecting database objects; constant, so build it once
+_DB_SEARCH_FILTER = {"property": "object", "value": "database"}
+
+# Shared async HTTP client: one keep-alive connection pool to
+# api.notion.com for all tokens (auth is sent per request), so concurrent
+# Notion calls multiplex over warm connections instead of paying a TLS
+# handshake each. Created lazily so importing this module stays cheap.
+_async_http: Optional[httpx.AsyncClient] = None
+
+
+def _get_async_http() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _async_http
+    if _async_http is None:
+        _async_http = httpx.AsyncClient(
+            base_url=_API_BASE,
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _async_http
+
 
 class NotionClientError(Exception):
     """Base exception for Notion client errors"""
@@ -43,7 +74,171 @@ class NotionClient:
         """
         self.access_token = access_token
         self.client = Client(auth=access_token)
-        logger.info("Notion client initialized")
+        self._auth_headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Notion-Version": _NOTION_VERSION,
+        }
+        logger.debug("Notion client initialized")
+
+    async def _request_async(
+        self, method: str, path: str, json_body: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Issue an async Notion API request on the shared connection pool.
+
+        Args:
+            method: HTTP method
+            path: API path relative to the Notion v1 base URL
+            json_body: Optional JSON request body
+
+        Returns:
+            Decoded JSON response
+
+        Raises:
+            NotionAPIError: If the API request fails
+        """
+        try:
+            response = await _get_async_http().request(
+                method, path, headers=self._auth_headers, json=json_body
+            )
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error("Notion API request failed: %s", e)
+            raise NotionAPIError(f"Notion API request failed: {str(e)}")
+        except httpx.HTTPError as e:
+            logger.error("HTTP error calling Notion API: %s", e)
+            raise NotionAPIError(f"HTTP error calling Notion API: {str(e)}")
+
+    async def iter_databases(self) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate all databases across search result pages.
+
+        The next page is requested as soon as the current one arrives, so
+        network latency overlaps with consumer processing instead of
+        stacking serially. Accounts with >100 databases would otherwise be
+        silently truncated to the first page.
+
+        Yields:
+            Database objects with id, title, and properties
+
+        Raises:
+            NotionAPIError: If any page request fails
+        """
+        body = {"filter": _DB_SEARCH_FILTER}
+        response = await self._request_async("POST", "/search", body)
+
+        while True:
+            next_task = None
+            if response.get("has_more") and response.get("next_cursor"):
+                next_task = asyncio.create_task(
+                    self._request_async(
+                        "POST",
+                        "/search",
+                        {**body, "start_cursor": response["next_cursor"]},
+                    )
+                )
+
+            for db in response.get("results", []):
+                yield {
+                    "id": db["id"],
+                    "title": self._extract_title(db.get("title", [])),
+                    "properties": db.get("properties", {}),
+                }
+
+            if next_task is None:
+                return
+            response = await next_task
+
+    async def get_databases_async(self) -> List[Dict[str, Any]]:
+        """
+        Async variant of get_databases using the shared connection pool.
+        Follows pagination, unlike the sync SDK wrapper.
+
+        Returns:
+            List of database objects with id, title, and properties
+
+        Raises:
+            NotionAPIError: If the API request fails
+        """
+        return [db async for db in self.iter_databases()]
+
+    async def get_database_schema_async(self, db_id: str) -> Dict[str, Any]:
+        """
+        Async variant of get_database_schema using the shared connection pool.
+
+        Args:
+            db_id: Notion database ID
+
+        Returns:
+            Dictionary containing database properties and their types
+
+        Raises:
+            NotionAPIError: If the API request fails
+        """
+        database = await self._request_async("GET", f"/databases/{db_id}")
+
+        return {
+            "id": database["id"],
+            "title": self._extract_title(database.get("title", [])),
+            "properties": database.get("properties", {}),
+        }
+
+    async def get_database_schema_cached(self, db_id: str) -> Dict[str, Any]:
+        """
+        Retrieve database schema, served from Redis when fresh.
+
+        Notion schemas rarely change within a registration flow, so a short
+        TTL skips the external API round-trip on retries and duplicate
+        clicks (Notion rate-limits at ~3 req/s). Misses go through the
+        async client, so the event loop keeps serving other requests
+        during the Notion round-trip.
+
+        Args:
+            db_id: Notion database ID
+
+        Returns:
+            Dictionary containing database properties and their types
+
+        Raises:
+            NotionAPIError: If the API request fails on a cache miss
+        """
+        redis_client = get_redis_client()
+        key = f"notion:schema:{db_id}"
+
+        # redis-py is blocking; keep it off the shared event loop
+        cached = await asyncio.to_thread(redis_client.get, key)
+        if cached:
+            return orjson.loads(cached)
+
+        schema = await self.get_database_schema_async(db_id)
+        await asyncio.to_thread(
+            redis_client.set_with_ttl, key, orjson.dumps(schema).decode(), 300
+        )
+        return schema
+
+    async def create_page_async(
+        self, db_id: str, properties: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Async variant of create_page; bulk callers can fan these out with
+        asyncio.gather over the shared connection pool.
+
+        Args:
+            db_id: Notion database ID
+            properties: Page properties matching the database schema
+
+        Returns:
+            Created page object
+
+        Raises:
+            NotionAPIError: If the API request fails
+        """
+        return await self._request_async(
+            "POST",
+            "/pages",
+            {"parent": {"database_id": db_id}, "properties": properties},
+        )
 
     def get_databases(self) -> List[Dict[str, Any]]:
         """
@@ -56,10 +251,8 @@ class NotionClient:
             NotionAPIError: If the API request fails
         """
         try:
-            logger.info("Fetching user databases")
-            response = self.client.search(
-                filter={"property": "object", "value": "database"}
-            )
+            logger.debug("Fetching user databases")
+            response = self.client.search(filter=_DB_SEARCH_FILTER)
 
             databases = []
             for db in response.get("results", []):
@@ -71,14 +264,14 @@ class NotionClient:
                     }
                 )
 
-            logger.info(f"Retrieved {len(databases)} databases")
+            logger.info("Retrieved %d databases", len(databases))
             return databases
 
         except APIResponseError as e:
-            logger.error(f"Failed to fetch databases: {e}")
+            logger.error("Failed to fetch databases: %s", e)
             raise NotionAPIError(f"Failed to fetch databases: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error fetching databases: {e}")
+            logger.error("Unexpected error fetching databases: %s", e)
             raise NotionAPIError(f"Unexpected error: {str(e)}")
 
     def get_database_schema(self, db_id: str) -> Dict[str, Any]:
@@ -95,7 +288,7 @@ class NotionClient:
             NotionAPIError: If the API request fails
         """
         try:
-            logger.info(f"Fetching schema for database {db_id}")
+            logger.debug("Fetching schema for database %s", db_id)
             database = self.client.databases.retrieve(database_id=db_id)
 
             schema = {
@@ -104,14 +297,14 @@ class NotionClient:
                 "properties": database.get("properties", {}),
             }
 
-            logger.info(f"Retrieved schema for database {db_id}")
+            logger.debug("Retrieved schema for database %s", db_id)
             return schema
 
         except APIResponseError as e:
-            logger.error(f"Failed to fetch database schema: {e}")
+            logger.error("Failed to fetch database schema: %s", e)
             raise NotionAPIError(f"Failed to fetch database schema: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error fetching database schema: {e}")
+            logger.error("Unexpected error fetching database schema: %s", e)
             raise NotionAPIError(f"Unexpected error: {str(e)}")
 
     def query_database(
@@ -135,7 +328,7 @@ class NotionClient:
             NotionAPIError: If the API request fails
         """
         try:
-            logger.info(f"Querying database {db_id}")
+            logger.debug("Querying database %s", db_id)
 
             query_params = {}
             if filter_conditions:
@@ -146,14 +339,14 @@ class NotionClient:
             response = self.client.databases.query(database_id=db_id, **query_params)
 
             pages = response.get("results", [])
-            logger.info(f"Query returned {len(pages)} pages")
+            logger.debug("Query returned %d pages", len(pages))
             return pages
 
         except APIResponseError as e:
-            logger.error(f"Failed to query database: {e}")
+            logger.error("Failed to query database: %s", e)
             raise NotionAPIError(f"Failed to query database: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error querying database: {e}")
+            logger.error("Unexpected error querying database: %s", e)
             raise NotionAPIError(f"Unexpected error: {str(e)}")
 
     def create_page(self, db_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
@@ -171,20 +364,20 @@ class NotionClient:
             NotionAPIError: If the API request fails
         """
         try:
-            logger.info(f"Creating page in database {db_id}")
+            logger.debug("Creating page in database %s", db_id)
 
             page = self.client.pages.create(
                 parent={"database_id": db_id}, properties=properties
             )
 
-            logger.info(f"Created page {page['id']}")
+            logger.debug("Created page %s", page["id"])
             return page
 
         except APIResponseError as e:
-            logger.error(f"Failed to create page: {e}")
+            logger.error("Failed to create page: %s", e)
             raise NotionAPIError(f"Failed to create page: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error creating page: {e}")
+            logger.error("Unexpected error creating page: %s", e)
             raise NotionAPIError(f"Unexpected error: {str(e)}")
 
     def update_page(self, page_id: str, properties: Dict[str, Any]) -> Dict[str, Any]:
@@ -202,18 +395,18 @@ class NotionClient:
             NotionAPIError: If the API request fails
         """
         try:
-            logger.info(f"Updating page {page_id}")
+            logger.debug("Updating page %s", page_id)
 
             page = self.client.pages.update(page_id=page_id, properties=properties)
 
-            logger.info(f"Updated page {page_id}")
+            logger.debug("Updated page %s", page_id)
             return page
 
         except APIResponseError as e:
-            logger.error(f"Failed to update page: {e}")
+            logger.error("Failed to update page: %s", e)
             raise NotionAPIError(f"Failed to update page: {str(e)}")
         except Exception as e:
-            logger.error(f"Unexpected error updating page: {e}")
+            logger.error("Unexpected error updating page: %s", e)
             raise NotionAPIError(f"Unexpected error: {str(e)}")
 
     def _extract_title(self, title_array: List[Dict[str, Any]]) -> str:
@@ -226,10 +419,9 @@ class NotionClient:
         Returns:
             Plain text title
         """
-        if not title_array:
-            return ""
-
-        return "".join([item.get("plain_text", "") for item in title_array])
+        # join over a generator: no intermediate list, and an empty
+        # iterable joins to "" so the empty-array check is implicit
+        return "".join(item.get("plain_text", "") for item in title_array)
 
     @staticmethod
     def refresh_token_if_needed(access_token: str) -> str:
@@ -248,3 +440,31 @@ class NotionClient:
         # This is a placeholder for future token refresh logic
         logger.debug("Token refresh check (Notion tokens don't expire)")
         return access_token
+
+
+# Bounded LRU of NotionClient instances keyed by access token, so repeat
+# requests for the same user reuse the SDK client (and its keep-alive
+# session) instead of constructing a new one per request
+_CLIENT_POOL_MAX = 256
+_client_pool: "OrderedDict[str, NotionClient]" = OrderedDict()
+
+
+def get_notion_client(access_token: str) -> NotionClient:
+    """
+    Get a pooled NotionClient for the given access token.
+
+    Args:
+        access_token: Notion OAuth access token
+
+    Returns:
+        A shared NotionClient instance for that token
+    """
+    client = _client_pool.get(access_token)
+    if client is None:
+        client = NotionClient(access_token)
+        _client_pool[access_token] = client
+        if len(_client_pool) > _CLIENT_POOL_MAX:
+            _client_pool.popitem(last=False)
+    else:
+        _client_pool.move_to_end(access_token)
+    return client
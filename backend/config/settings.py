@@ -4,6 +4,8 @@ Loads environment variables and provides application configuration.
 """
 
 import os
+from functools import lru_cache
+
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -40,8 +42,8 @@ class Settings:
         "FLASK_SECRET_KEY", "dev-secret-key-change-in-production"
     )
 
-    # Logging
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    # Logging (quiet by default in production; override with LOG_LEVEL)
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING" if FLASK_ENV == "production" else "INFO")
 
     # Redis Configuration (Google Cloud Memorystore for Production)
     # Leave empty for local development (will use in-memory storage)
@@ -52,24 +54,25 @@ class Settings:
     POLLING_INTERVAL_SECONDS = int(os.getenv("POLLING_INTERVAL_SECONDS", "60"))
     MAX_CONCURRENT_PROCESSING = int(os.getenv("MAX_CONCURRENT_PROCESSING", "5"))
 
-    def validate(self):
-        """
-        Validates that all required configuration is present.
-        Raises ValueError if required settings are missing.
-        """
-        required_settings = [
+    # Settings that must be present for the full pipeline to run
+    _REQUIRED = frozenset(
+        {
             "NOTION_CLIENT_ID",
             "NOTION_CLIENT_SECRET",
             "NOTION_REDIRECT_URI",
             "WHISPER_API_KEY",
             "GEMINI_API_KEY",
             "DATABASE_URL",
-        ]
+        }
+    )
 
-        missing = []
-        for setting in required_settings:
-            if not getattr(self, setting):
-                missing.append(setting)
+    @classmethod
+    def validate(cls):
+        """
+        Validates that all required configuration is present.
+        Raises ValueError if required settings are missing.
+        """
+        missing = sorted(k for k in cls._REQUIRED if not getattr(cls, k))
 
         if missing:
             raise ValueError(
@@ -79,3 +82,9 @@ class Settings:
     def __repr__(self):
         """String representation (hides sensitive values)"""
         return f"<Settings env={self.FLASK_ENV} log_level={self.LOG_LEVEL}>"
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the shared Settings instance (constructed once per process)."""
+    return Settings()
@@ -2,11 +2,11 @@
 Database management endpoints for Content and Link Databases
 """
 
-import asyncio
 import logging
 from flask import Blueprint, jsonify, request, session
 
 from services.database_service import DatabaseService
+from utils.async_runner import run_async
 
 logger = logging.getLogger(__name__)
 
@@ -14,20 +14,21 @@ logger = logging.getLogger(__name__)
 database_bp = Blueprint("database", __name__, url_prefix="/api")
 
 
-def run_async(coro):
-    """Helper to run async functions in Flask endpoints"""
-    # Always create a fresh event loop for each request to avoid
-    # "bound to a different event loop" errors with Prisma
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+@database_bp.before_request
+def require_auth():
+    """
+    Reject unauthenticated requests before any view runs.
 
-    try:
-        result = loop.run_until_complete(coro)
-        return result
-    finally:
-        # Don't close the loop immediately as Prisma might need it
-        # Let it be garbage collected
-        pass
+    Running this as a blueprint hook means unauthorized callers are turned
+    away before the request body is read or parsed.
+    """
+    # CORS preflights carry no cookies and must succeed for the browser to
+    # send the real request; flask-cors answers them after this hook
+    if request.method == "OPTIONS":
+        return None
+    if not session.get("user_id"):
+        return jsonify({"error": "Unauthorized - please login first"}), 401
+    return None
 
 
 @database_bp.route("/databases/register", methods=["POST"])
@@ -37,13 +38,10 @@ def register_content_database():
     Retrieves and stores database schema for content mapping.
     """
     try:
-        # Get user_id from session
-        user_id = session.get("user_id")
-        if not user_id:
-            return jsonify({"error": "Unauthorized - please login first"}), 401
+        user_id = session["user_id"]
 
-        # Parse request body
-        data = request.get_json()
+        # Parse request body (auth already passed, so the parse is not wasted)
+        data = request.get_json(silent=True, cache=False)
         if not data:
             return jsonify({"error": "Request body is required"}), 400
 
@@ -76,10 +74,7 @@ def list_databases():
     Returns db_id, tag, schema, and prompt for each database.
     """
     try:
-        # Get user_id from session
-        user_id = session.get("user_id")
-        if not user_id:
-            return jsonify({"error": "Unauthorized - please login first"}), 401
+        user_id = session["user_id"]
 
         # Call service layer
         result = run_async(DatabaseService.list_registered_databases(user_id))
@@ -98,10 +93,7 @@ def list_available_databases():
     This helps users discover which databases they can register.
     """
     try:
-        # Get user_id from session
-        user_id = session.get("user_id")
-        if not user_id:
-            return jsonify({"error": "Unauthorized - please login first"}), 401
+        user_id = session["user_id"]
 
         # Call service layer
         result = run_async(DatabaseService.list_available_databases(user_id))
@@ -120,13 +112,10 @@ def register_link_database():
     Validates required fields and stores database ID.
     """
     try:
-        # Get user_id from session
-        user_id = session.get("user_id")
-        if not user_id:
-            return jsonify({"error": "Unauthorized - please login first"}), 401
+        user_id = session["user_id"]
 
-        # Parse request body
-        data = request.get_json()
+        # Parse request body (auth already passed, so the parse is not wasted)
+        data = request.get_json(silent=True, cache=False)
         if not data:
             return jsonify({"error": "Request body is required"}), 400
 
@@ -2,11 +2,19 @@
 Health check endpoint for monitoring
 """
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response
 
 # Create Blueprint for health endpoint
 health_bp = Blueprint("health", __name__)
 
+# The payload never changes, so serialize it once at import time instead of
+# rebuilding dict + JSON for every liveness probe. The Response itself must
+# be per-request: after_request hooks (e.g. flask-cors) mutate its headers,
+# so a shared instance would leak one caller's headers to the next
+_HEALTH_BODY = (
+    b'{"status":"healthy","service":"social-video-processor","version":"1.0.0"}'
+)
+
 
 @health_bp.route("/health", methods=["GET"])
 def health_check():
@@ -14,6 +22,4 @@ def health_check():
     Health check endpoint for Cloud Run monitoring.
     Returns service status and connectivity checks.
     """
-    return jsonify(
-        {"status": "healthy", "service": "social-video-processor", "version": "1.0.0"}
-    ), 200
+    return Response(_HEALTH_BODY, status=200, mimetype="application/json")
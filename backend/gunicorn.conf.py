@@ -0,0 +1,16 @@
+"""
+Gunicorn configuration for production serving.
+
+Usage:
+    gunicorn -c gunicorn.conf.py app:app
+
+Threaded workers let each process serve multiple I/O-bound requests
+(Notion/Postgres/Redis round-trips) concurrently instead of serializing
+them the way the single-threaded Flask dev server does.
+"""
+
+bind = "0.0.0.0:8080"
+workers = 2
+threads = 8
+worker_class = "gthread"
+timeout = 120
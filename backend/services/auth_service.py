@@ -4,23 +4,66 @@ Handles token exchange and user management
 """
 
 import asyncio
+import atexit
 import logging
 from typing import Optional, Dict, Any
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 
-from config.settings import Settings
+from config.settings import get_settings
+from services.token_cache import store_user_token
+from utils.async_runner import run_async
 from utils.db import get_db, ensure_connected
 
 logger = logging.getLogger(__name__)
 
 
+def _extract_oauth_id(token_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Pull the OAuth identity out of a Notion token response.
+
+    For user-owned tokens this is the Notion user id; for workspace-owned
+    tokens it is the workspace id.
+
+    Args:
+        token_data: Token response from Notion OAuth
+
+    Returns:
+        The OAuth id, or None if it cannot be determined
+    """
+    owner = token_data.get("owner")
+    if owner and owner.get("type") == "user":
+        user = owner.get("user")
+        return user["id"] if user and "id" in user else None
+    return token_data.get("workspace_id")
+
+
 class AuthService:
     """Service for handling Notion OAuth authentication"""
 
     def __init__(self):
         """Initialize auth service with settings"""
-        self.settings = Settings()
+        self.settings = get_settings()
+        # Keep-alive session so token exchanges reuse the TCP/TLS connection
+        # to api.notion.com instead of paying a fresh handshake per callback.
+        # Retries cover transient gateway errors; tight connect/read timeouts
+        # keep a slow Notion response from pinning a worker thread
+        self._http = requests.Session()
+        self._http.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=32,
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.1,
+                    status_forcelist=[502, 503, 504],
+                    allowed_methods=["POST"],
+                ),
+            ),
+        )
+        atexit.register(self._http.close)
 
     def exchange_code_for_token(self, code: str) -> Optional[Dict[str, Any]]:
         """
@@ -40,8 +83,8 @@ class AuthService:
         }
 
         try:
-            logger.info("Exchanging authorization code for access token")
-            response = requests.post(
+            logger.debug("Exchanging authorization code for access token")
+            response = self._http.post(
                 token_url,
                 auth=(
                     self.settings.NOTION_CLIENT_ID,
@@ -49,7 +92,7 @@ class AuthService:
                 ),
                 json=auth_data,
                 headers={"Content-Type": "application/json"},
-                timeout=30,
+                timeout=(3, 10),
             )
 
             if response.status_code != 200:
@@ -81,27 +124,15 @@ class AuthService:
         """
         try:
             access_token = token_data.get("access_token")
-            owner = token_data.get("owner", {})
-            workspace_id = token_data.get("workspace_id")
-
-            # Extract user information
-            user_type = owner.get("type")  # "user" or "workspace"
-            if user_type == "user":
-                oauth_id = owner.get("user", {}).get("id")
-            else:
-                oauth_id = workspace_id
+            oauth_id = _extract_oauth_id(token_data)
 
             if not oauth_id:
                 logger.error("Could not extract user ID from token response")
                 return None
 
-            # Store user in database
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            user = loop.run_until_complete(
-                self._create_or_update_user(oauth_id, access_token)
-            )
-            loop.close()
+            # Store user in database via the shared background loop so the
+            # Prisma connection is reused across requests
+            user = run_async(self._create_or_update_user(oauth_id, access_token))
 
             return user
 
@@ -123,20 +154,24 @@ class AuthService:
         await ensure_connected()
         db = get_db()
 
-        # Check if user already exists
-        existing_user = await db.user.find_unique(where={"oauthId": oauth_id})
-
-        if existing_user:
-            # Update existing user's token
-            logger.info("Updating existing user: %s", oauth_id)
-            user = await db.user.update(
-                where={"oauthId": oauth_id}, data={"notionAccessToken": access_token}
-            )
-        else:
-            # Create new user
-            logger.info("Creating new user: %s", oauth_id)
-            user = await db.user.create(
-                data={"oauthId": oauth_id, "notionAccessToken": access_token}
-            )
+        # Single round-trip create-or-update; also avoids the race where two
+        # concurrent callbacks both see "no user" and collide on create
+        logger.debug("Upserting user: %s", oauth_id)
+        user = await db.user.upsert(
+            where={"oauthId": oauth_id},
+            data={
+                "create": {"oauthId": oauth_id, "notionAccessToken": access_token},
+                "update": {"notionAccessToken": access_token},
+            },
+        )
+
+        # Write the fresh token through so cached copies never go stale
+        # (to_thread keeps the blocking Redis set off the event loop)
+        await asyncio.to_thread(store_user_token, user.id, access_token)
 
         return user
+
+
+# Shared instance — callers should import this instead of constructing
+# their own AuthService (one Settings lookup, one HTTP session per process)
+auth_service = AuthService()
@@ -3,14 +3,29 @@ Database service for Content and Link Database operations.
 Handles business logic for database registration and retrieval.
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, Tuple
 
-from clients.notion_client import NotionClient, NotionAPIError
+from clients.notion_client import NotionAPIError, get_notion_client
+from services import db_list_cache
+from services.token_cache import get_user_token
 from utils.db import get_db, ensure_connected
+from utils.serial import canonical
 
 logger = logging.getLogger(__name__)
 
+# Fields a Link Database must expose, with their expected Notion types.
+# Hoisted so the validation path allocates nothing per request.
+_LINK_DB_FIELD_TYPES = {
+    "url": "url",
+    "tag": "select",
+    "processing_type": "select",
+    "status": "select",
+    "updated_time": "date",
+}
+_LINK_DB_REQUIRED_FIELDS = tuple(_LINK_DB_FIELD_TYPES)
+
 
 class DatabaseService:
     """Service for managing Content and Link Database operations"""
@@ -34,24 +49,18 @@ class DatabaseService:
         await ensure_connected()
         db = get_db()
 
-        # Get user and access token
-        user = await db.user.find_unique(where={"id": user_id})
-        if not user:
+        # Tag uniqueness is enforced by the INSERT below (ON CONFLICT against
+        # the (user_id, tag) unique index), so no separate pre-check query
+        access_token = await get_user_token(user_id)
+        if not access_token:
             return {"error": "User not found"}, 404
 
-        # Check if tag is already used by this user
-        existing_schema = await db.notionschema.find_first(
-            where={"userId": user_id, "tag": tag}
-        )
-        if existing_schema:
-            return {"error": f"Tag '{tag}' is already in use"}, 409
-
         # Retrieve database schema from Notion
         try:
-            notion_client = NotionClient(user.notionAccessToken)
-            schema_data = notion_client.get_database_schema(db_id)
+            notion_client = get_notion_client(access_token)
+            schema_data = await notion_client.get_database_schema_cached(db_id)
 
-            logger.info(
+            logger.debug(
                 "Schema data properties: %s",
                 list(schema_data.get("properties", {}).keys()),
             )
@@ -68,15 +77,18 @@ class DatabaseService:
             if prompt:
                 create_data["prompt"] = prompt
 
-            # Use execute_raw to bypass GraphQL parsing issues with special characters in JSON keys
-            import json
-
-            schema_json_str = json.dumps(schema_data["properties"])
+            # Serialize via orjson (canonical form) to bypass GraphQL parsing
+            # issues with special characters in JSON keys
+            schema_json_str = canonical(schema_data["properties"]).decode()
 
+            # ON CONFLICT folds the duplicate-tag check into the write: an
+            # empty result means the (user_id, tag) row already existed,
+            # race-free against concurrent registrations
             notion_schema = await db.query_raw(
                 f"""
                 INSERT INTO notion_schemas (user_id, db_id, tag, schema, prompt, created_at, updated_at)
                 VALUES ($1, $2, $3, $4::jsonb, $5, NOW(), NOW())
+                ON CONFLICT (user_id, tag) DO NOTHING
                 RETURNING id, user_id, db_id, tag, schema, prompt, created_at, updated_at
                 """,
                 user_id,
@@ -86,8 +98,8 @@ class DatabaseService:
                 prompt,
             )
 
-            if not notion_schema or len(notion_schema) == 0:
-                raise Exception("Failed to insert schema into database")
+            if not notion_schema:
+                return {"error": f"Tag '{tag}' is already in use"}, 409
 
             logger.info(
                 "Content Database registered: user_id=%s, tag=%s, db_id=%s",
@@ -96,6 +108,8 @@ class DatabaseService:
                 db_id,
             )
 
+            await db_list_cache.invalidate(user_id)
+
             schema_record = notion_schema[0]
             return {
                 "message": "Content Database registered successfully",
@@ -122,6 +136,10 @@ class DatabaseService:
         Returns:
             Tuple of (response_dict, status_code)
         """
+        cached = await db_list_cache.cache_get("registered", user_id)
+        if cached is not None:
+            return cached, 200
+
         await ensure_connected()
         db = get_db()
 
@@ -135,24 +153,24 @@ class DatabaseService:
             where={"userId": user_id}, order={"createdAt": "desc"}
         )
 
-        databases = []
-        for schema in schemas:
-            databases.append(
-                {
-                    "id": schema.id,
-                    "db_id": schema.dbId,
-                    "tag": schema.tag,
-                    "schema": schema.schemaData,
-                    "prompt": schema.prompt,
-                    "created_at": schema.createdAt.isoformat()
-                    if schema.createdAt
-                    else None,
-                }
-            )
+        databases = [
+            {
+                "id": schema.id,
+                "db_id": schema.dbId,
+                "tag": schema.tag,
+                "schema": schema.schemaData,
+                "prompt": schema.prompt,
+                "created_at": schema.createdAt.isoformat(),
+            }
+            for schema in schemas
+        ]
+
+        logger.debug("Listed %d databases for user_id=%s", len(databases), user_id)
 
-        logger.info("Listed %d databases for user_id=%s", len(databases), user_id)
+        result = {"databases": databases}
+        await db_list_cache.cache_set("registered", user_id, result)
 
-        return {"databases": databases}, 200
+        return result, 200
 
     @staticmethod
     async def list_available_databases(user_id: int) -> Tuple[Dict[str, Any], int]:
@@ -165,24 +183,30 @@ class DatabaseService:
         Returns:
             Tuple of (response_dict, status_code)
         """
+        cached = await db_list_cache.cache_get("available", user_id)
+        if cached is not None:
+            return cached, 200
+
         await ensure_connected()
-        db = get_db()
 
-        # Get user and access token
-        user = await db.user.find_unique(where={"id": user_id})
-        if not user:
+        # Get user's access token (Redis-cached)
+        access_token = await get_user_token(user_id)
+        if not access_token:
             return {"error": "User not found"}, 404
 
         # Get databases from Notion
         try:
-            notion_client = NotionClient(user.notionAccessToken)
-            databases = notion_client.get_databases()
+            notion_client = get_notion_client(access_token)
+            databases = await notion_client.get_databases_async()
 
-            logger.info(
+            logger.debug(
                 "Listed %d available databases for user_id=%s", len(databases), user_id
             )
 
-            return {"databases": databases}, 200
+            result = {"databases": databases}
+            await db_list_cache.cache_set("available", user_id, result)
+
+            return result, 200
 
         except NotionAPIError as e:
             logger.error("Failed to retrieve available databases: %s", e)
@@ -205,59 +229,40 @@ class DatabaseService:
         await ensure_connected()
         db = get_db()
 
-        # Get user and access token
-        user = await db.user.find_unique(where={"id": user_id})
-        if not user:
+        # Fetch the token and the existing-registration check concurrently
+        access_token, existing_link_db = await asyncio.gather(
+            get_user_token(user_id),
+            db.linkdatabase.find_unique(where={"userId": user_id}),
+        )
+        if not access_token:
             return {"error": "User not found"}, 404
-
-        # Check if user already has a Link Database registered
-        existing_link_db = await db.linkdatabase.find_unique(where={"userId": user_id})
         if existing_link_db:
             return {"error": "Link Database already registered for this user"}, 409
 
         # Validate Link Database has required fields
         try:
-            notion_client = NotionClient(user.notionAccessToken)
-            schema_data = notion_client.get_database_schema(db_id)
+            notion_client = get_notion_client(access_token)
+            schema_data = await notion_client.get_database_schema_cached(db_id)
 
-            # Check for required fields
+            # Check presence and type of each required field in a single pass
             properties = schema_data.get("properties", {})
-            required_fields = [
-                "url",
-                "tag",
-                "processing_type",
-                "status",
-                "updated_time",
-            ]
             missing_fields = []
-
-            for field in required_fields:
-                if field not in properties:
+            invalid_types = []
+            for field, expected in _LINK_DB_FIELD_TYPES.items():
+                prop = properties.get(field)
+                if prop is None:
                     missing_fields.append(field)
+                elif prop.get("type") != expected:
+                    invalid_types.append(
+                        f"{field} (expected {expected}, got {prop.get('type')})"
+                    )
 
             if missing_fields:
                 return {
                     "error": f"Link Database is missing required fields: {', '.join(missing_fields)}",
-                    "required_fields": required_fields,
+                    "required_fields": list(_LINK_DB_REQUIRED_FIELDS),
                 }, 400
 
-            # Validate field types
-            field_types = {
-                "url": "url",
-                "tag": "select",
-                "processing_type": "select",
-                "status": "select",
-                "updated_time": "date",
-            }
-
-            invalid_types = []
-            for field, expected_type in field_types.items():
-                actual_type = properties[field].get("type")
-                if actual_type != expected_type:
-                    invalid_types.append(
-                        f"{field} (expected {expected_type}, got {actual_type})"
-                    )
-
             if invalid_types:
                 return {
                     "error": f"Link Database has invalid field types: {', '.join(invalid_types)}"
@@ -0,0 +1,101 @@
+"""
+Short-TTL cache for the database list endpoints.
+
+The frontend polls GET /api/databases and /api/databases/available; each
+hit costs a Postgres query or a Notion API round-trip. Results are cached
+for a few seconds in-process (no serialization cost) with Redis behind it
+so workers share warm entries. Registration invalidates the cache.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+import orjson
+
+from utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+_TTL_SECONDS = 30
+
+# kind is "registered" or "available"; values are (expires_at, payload).
+# LRU-capped so the process does not retain a payload per user forever
+_LOCAL_MAX_KEYS = 1024
+_local: "OrderedDict[Tuple[str, int], Tuple[float, Any]]" = OrderedDict()
+
+
+def _redis_key(kind: str, user_id: int) -> str:
+    """Redis key for a user's cached list payload."""
+    return f"dblist:{kind}:{user_id}"
+
+
+def _local_set(kind: str, user_id: int, payload: Any):
+    """Store a payload in the in-process tier, evicting LRU past the cap."""
+    _local[(kind, user_id)] = (time.monotonic() + _TTL_SECONDS, payload)
+    _local.move_to_end((kind, user_id))
+    while len(_local) > _LOCAL_MAX_KEYS:
+        _local.popitem(last=False)
+
+
+async def cache_get(kind: str, user_id: int) -> Optional[Any]:
+    """
+    Look up a cached list payload, in-process first, then Redis.
+
+    Args:
+        kind: Which list ("registered" or "available")
+        user_id: User ID from session
+
+    Returns:
+        The cached payload, or None on miss
+    """
+    entry = _local.get((kind, user_id))
+    if entry:
+        if entry[0] > time.monotonic():
+            _local.move_to_end((kind, user_id))
+            return entry[1]
+        del _local[(kind, user_id)]
+
+    # redis-py is blocking; keep it off the shared event loop
+    cached = await asyncio.to_thread(
+        get_redis_client().get, _redis_key(kind, user_id)
+    )
+    if cached:
+        payload = orjson.loads(cached)
+        _local_set(kind, user_id, payload)
+        return payload
+
+    return None
+
+
+async def cache_set(kind: str, user_id: int, payload: Any):
+    """
+    Store a list payload in both cache levels.
+
+    Args:
+        kind: Which list ("registered" or "available")
+        user_id: User ID from session
+        payload: The response payload to cache
+    """
+    _local_set(kind, user_id, payload)
+    await asyncio.to_thread(
+        get_redis_client().set_with_ttl,
+        _redis_key(kind, user_id),
+        orjson.dumps(payload).decode(),
+        _TTL_SECONDS,
+    )
+
+
+async def invalidate(user_id: int):
+    """
+    Drop a user's cached lists (called after a successful registration).
+
+    Args:
+        user_id: User ID whose cached lists are now stale
+    """
+    redis_client = get_redis_client()
+    for kind in ("registered", "available"):
+        _local.pop((kind, user_id), None)
+        await asyncio.to_thread(redis_client.delete, _redis_key(kind, user_id))
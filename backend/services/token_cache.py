@@ -0,0 +1,96 @@
+"""
+Redis-backed cache for Notion access tokens.
+
+Every database endpoint needs the caller's Notion token and was paying a
+Postgres round-trip for it; tokens change only on re-auth, so a Redis GET
+(sub-millisecond) serves the common case. The OAuth callback writes through
+on token refresh.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from utils.db import get_db
+from utils.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Notion OAuth tokens do not expire; the TTL just bounds staleness if a
+# token is rotated outside the normal callback path
+_TOKEN_TTL_SECONDS = 3600
+
+# In-process layer in front of Redis: a short TTL keeps repeated lookups
+# within the same worker from paying even the Redis round-trip, while
+# bounding how long a rotated token can linger in another process.
+# LRU-capped so the process does not retain an entry per user forever
+_LOCAL_TTL_SECONDS = 60
+_LOCAL_MAX_KEYS = 1024
+_local: "OrderedDict[int, Tuple[float, str]]" = OrderedDict()
+
+
+def _token_key(user_id: int) -> str:
+    """Redis key for a user's cached access token."""
+    return f"user:token:{user_id}"
+
+
+def _local_set(user_id: int, access_token: str):
+    """Store a token in the in-process tier, evicting LRU past the cap."""
+    _local[user_id] = (time.monotonic() + _LOCAL_TTL_SECONDS, access_token)
+    _local.move_to_end(user_id)
+    while len(_local) > _LOCAL_MAX_KEYS:
+        _local.popitem(last=False)
+
+
+async def get_user_token(user_id: int) -> Optional[str]:
+    """
+    Get a user's Notion access token, from Redis when cached.
+
+    Args:
+        user_id: User ID from session
+
+    Returns:
+        The access token, or None if the user does not exist
+    """
+    entry = _local.get(user_id)
+    if entry:
+        if entry[0] > time.monotonic():
+            _local.move_to_end(user_id)
+            return entry[1]
+        del _local[user_id]
+
+    # redis-py is blocking; keep it off the shared event loop
+    redis_client = get_redis_client()
+    token = await asyncio.to_thread(redis_client.get, _token_key(user_id))
+    if token:
+        _local_set(user_id, token)
+        return token
+
+    user = await get_db().user.find_unique(where={"id": user_id})
+    if not user:
+        return None
+
+    _local_set(user_id, user.notionAccessToken)
+    await asyncio.to_thread(
+        redis_client.set_with_ttl,
+        _token_key(user_id),
+        user.notionAccessToken,
+        _TOKEN_TTL_SECONDS,
+    )
+    return user.notionAccessToken
+
+
+def store_user_token(user_id: int, access_token: str):
+    """
+    Write a fresh token through to the cache (called on OAuth refresh).
+
+    Args:
+        user_id: User ID
+        access_token: Newly issued Notion access token
+    """
+    _local_set(user_id, access_token)
+    get_redis_client().set_with_ttl(
+        _token_key(user_id), access_token, _TOKEN_TTL_SECONDS
+    )
@@ -94,6 +94,42 @@ class TestNotionClient:
         assert result == ""
 
 
+class TestStateToken:
+    """Test cases for the self-verifying OAuth state token"""
+
+    def test_minted_state_verifies(self):
+        """Test that a freshly minted state token round-trips"""
+        from endpoints.auth import _mint_state, _verify_state
+
+        assert _verify_state(_mint_state())
+
+    def test_tampered_signature_rejected(self):
+        """Test that flipping a signature character fails verification"""
+        from endpoints.auth import _mint_state, _verify_state
+
+        state = _mint_state()
+        tampered = state[:-1] + ("0" if state[-1] != "0" else "1")
+        assert not _verify_state(tampered)
+
+    def test_expired_state_rejected(self):
+        """Test that a correctly signed but stale state is rejected"""
+        import hmac
+        import time
+
+        from endpoints import auth
+
+        payload = f"nonce:{int(time.time()) - auth._STATE_TTL_SECONDS - 1}"
+        sig = hmac.new(auth._STATE_SECRET, payload.encode(), "sha256").hexdigest()[:16]
+        assert not auth._verify_state(f"{payload}:{sig}")
+
+    def test_garbage_state_rejected(self):
+        """Test that malformed state strings fail verification"""
+        from endpoints.auth import _verify_state
+
+        assert not _verify_state("invalid")
+        assert not _verify_state("")
+
+
 class TestOAuthEndpoints:
     """Test cases for OAuth endpoints"""
 
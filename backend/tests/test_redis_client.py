@@ -0,0 +1,104 @@
+"""
+Unit tests for the Redis client wrapper: in-memory fallback TTL semantics
+and the circuit-breaker re-probe behavior.
+"""
+
+from unittest.mock import Mock, patch
+
+from utils.redis_client import RedisClient
+
+
+def _client_without_redis():
+    """Build a RedisClient with no Redis configured (pure fallback mode)."""
+    settings = Mock(REDIS_HOST=None, REDIS_PORT=6379)
+    with patch("utils.redis_client.get_settings", return_value=settings):
+        return RedisClient()
+
+
+def _client_with_mock_redis():
+    """Build a RedisClient whose underlying redis.Redis is a Mock."""
+    settings = Mock(REDIS_HOST="localhost", REDIS_PORT=6379)
+    with patch("utils.redis_client.get_settings", return_value=settings), patch(
+        "utils.redis_client.redis.ConnectionPool"
+    ), patch("utils.redis_client.redis.Redis") as mock_redis_class:
+        client = RedisClient()
+    return client, mock_redis_class.return_value
+
+
+class TestFallbackStore:
+    """Test cases for the TTL-expiring in-memory fallback"""
+
+    def test_set_get_roundtrip(self):
+        """Test that a stored value is readable before its TTL passes"""
+        client = _client_without_redis()
+
+        assert client.set_with_ttl("key", "value", ttl_seconds=60)
+        assert client.get("key") == "value"
+        assert client.exists("key")
+
+    def test_entries_expire_after_ttl(self):
+        """Test that expired entries are evicted lazily on access"""
+        client = _client_without_redis()
+
+        client.set_with_ttl("key", "value", ttl_seconds=0)
+
+        assert client.get("key") is None
+        assert not client.exists("key")
+        # The expired entry must actually be gone, not just hidden
+        assert "key" not in client._in_memory_fallback
+
+    def test_nx_respects_existing_key(self):
+        """Test that nx=True refuses to overwrite a live entry"""
+        client = _client_without_redis()
+
+        assert client.set_with_ttl("key", "first", ttl_seconds=60, nx=True)
+        assert not client.set_with_ttl("key", "second", ttl_seconds=60, nx=True)
+        assert client.get("key") == "first"
+
+    def test_delete_reports_prior_existence(self):
+        """Test that delete returns whether the key existed"""
+        client = _client_without_redis()
+
+        client.set_with_ttl("key", "value", ttl_seconds=60)
+        assert client.delete("key")
+        assert not client.delete("key")
+
+
+class TestCircuitBreaker:
+    """Test cases for the availability circuit breaker"""
+
+    def test_failure_trips_breaker_and_falls_back(self):
+        """Test that an operation failure flips traffic to the fallback"""
+        client, raw = _client_with_mock_redis()
+        raw.setex.side_effect = Exception("connection lost")
+
+        # The write still succeeds via the in-memory fallback
+        assert client.set_with_ttl("key", "value", ttl_seconds=60)
+        assert not client.is_available()
+        assert client.get("key") == "value"
+
+    def test_probe_restores_after_backoff(self):
+        """Test that a successful ping after the backoff restores Redis"""
+        client, raw = _client_with_mock_redis()
+        raw.setex.side_effect = Exception("connection lost")
+        client.set_with_ttl("key", "value", ttl_seconds=60)
+
+        # Fast-forward past the backoff window; the next check re-probes
+        raw.ping.side_effect = None
+        client._next_probe_at = 0.0
+
+        assert client.is_available()
+        assert client._probe_backoff == 1.0
+
+    def test_failed_probe_doubles_backoff(self):
+        """Test that failed probes back off exponentially"""
+        client, raw = _client_with_mock_redis()
+        raw.setex.side_effect = Exception("connection lost")
+        client.set_with_ttl("key", "value", ttl_seconds=60)
+        backoff_after_trip = client._probe_backoff
+
+        raw.ping.side_effect = Exception("still down")
+        client._next_probe_at = 0.0
+
+        assert not client.is_available()
+        assert client._probe_backoff == backoff_after_trip * 2
@@ -0,0 +1,68 @@
+"""
+Persistent background event loop for running async code from sync Flask views.
+
+Creating a fresh event loop per request forces Prisma to reinitialize its
+async engine state on every call and leaks loops/file descriptors. Instead,
+a single loop runs forever on a daemon thread and coroutines are submitted
+to it, so database and HTTP connections are reused across requests.
+"""
+
+import asyncio
+import atexit
+import threading
+from typing import Any, Coroutine, Optional
+from concurrent.futures import Future
+
+
+class BackgroundLoop:
+    """
+    Runs a single asyncio event loop on a dedicated daemon thread.
+
+    All coroutines submitted through this class execute on the same loop,
+    which keeps Prisma's engine and any pooled connections warm for the
+    lifetime of the process.
+    """
+
+    def __init__(self):
+        """Create the loop and start it on a daemon thread."""
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever, name="background-loop", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, coro: Coroutine) -> Future:
+        """
+        Schedule a coroutine on the background loop.
+
+        Args:
+            coro: The coroutine to run
+
+        Returns:
+            concurrent.futures.Future resolving to the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self):
+        """Stop the loop from any thread."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+# Single shared loop for the whole process
+RUNNER = BackgroundLoop()
+
+atexit.register(RUNNER.stop)
+
+
+def run_async(coro: Coroutine, timeout: Optional[float] = None) -> Any:
+    """
+    Run a coroutine on the shared background loop and wait for its result.
+
+    Args:
+        coro: The coroutine to run
+        timeout: Optional timeout in seconds
+
+    Returns:
+        The coroutine's result
+    """
+    return RUNNER.submit(coro).result(timeout=timeout)
@@ -4,30 +4,34 @@ Prisma client initialization and database utilities.
 
 from prisma import Prisma
 from contextlib import asynccontextmanager
+import asyncio
 import logging
-import threading
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
-# Thread-local storage for Prisma client instances
-_thread_local = threading.local()
+# Single shared Prisma client. All database work runs on the background
+# event loop (utils/async_runner.py), so one client with Prisma's own
+# connection pool replaces the old per-thread instances that each paid a
+# full engine connect on first touch.
+_client: Optional[Prisma] = None
+
+# Serializes concurrent first-connection attempts during cold start
+_connect_lock = asyncio.Lock()
 
 
 def get_db() -> Prisma:
     """
-    Get a thread-local Prisma client instance.
-    This ensures each thread/request has its own client to avoid event loop conflicts.
+    Get the shared Prisma client instance.
 
     Returns:
         Prisma: The Prisma client instance
     """
-    if (
-        not hasattr(_thread_local, "prisma_client")
-        or _thread_local.prisma_client is None
-    ):
-        _thread_local.prisma_client = Prisma()
+    global _client
+    if _client is None:
+        _client = Prisma()
 
-    return _thread_local.prisma_client
+    return _client
 
 
 async def connect_db():
@@ -57,19 +61,22 @@ async def db_transaction():
     """
     Context manager for database transactions.
 
+    Wraps Prisma's interactive transaction, so the yielded client really
+    does run its statements inside one BEGIN/COMMIT (rolled back on error).
+
     Usage:
-        async with db_transaction():
-            await db.user.create(...)
-            await db.notionschema.create(...)
+        async with db_transaction() as tx:
+            await tx.user.create(...)
+            await tx.notionschema.create(...)
     """
+    await ensure_connected()
     db = get_db()
 
     try:
-        # Prisma Client Python handles transactions automatically
-        # This context manager is for explicit transaction control if needed
-        yield db
+        async with db.tx() as tx:
+            yield tx
     except Exception as e:
-        logger.error(f"Transaction failed: {e}")
+        logger.error("Transaction failed: %s", e)
         raise
 
 
@@ -80,4 +87,6 @@ async def ensure_connected():
     """
     db = get_db()
     if not db.is_connected():
-        await connect_db()
+        async with _connect_lock:
+            if not db.is_connected():
+                await connect_db()
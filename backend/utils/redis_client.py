@@ -3,13 +3,22 @@ Redis client for OAuth state management.
 Provides connection management with fallback to in-memory storage for local development.
 """
 
+import heapq
 import logging
+import threading
+import time
+from collections import OrderedDict
+
 import redis
 from typing import Optional
-from config.settings import Settings
+from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the in-memory fallback store, a second line of defense
+# behind TTL expiry for a long-running process without Redis.
+_FALLBACK_MAX_KEYS = 10000
+
 
 class RedisClient:
     """
@@ -18,10 +27,18 @@ class RedisClient:
 
     def __init__(self):
         """Initialize Redis client with configuration from settings."""
-        self.settings = Settings()
+        self.settings = get_settings()
         self._client: Optional[redis.Redis] = None
+        self._raw_client: Optional[redis.Redis] = None
+        self._pool: Optional[redis.ConnectionPool] = None
         self._available = False
-        self._in_memory_fallback = {}
+        # Circuit breaker: after a failure, re-probe with a ping once the
+        # backoff window passes instead of staying on the fallback forever
+        self._next_probe_at = 0.0
+        self._probe_backoff = 1.0
+        # Fallback entries are (value, expiry); the heap drives lazy eviction
+        self._in_memory_fallback: OrderedDict = OrderedDict()
+        self._expiry_heap: list = []
         self._initialize_connection()
 
     def _initialize_connection(self):
@@ -41,14 +58,20 @@ class RedisClient:
             return
 
         try:
-            # Attempt to connect to Redis
-            self._client = redis.Redis(
+            # Explicit connection pool: bounds the number of sockets under
+            # concurrent load and keeps them alive between commands instead
+            # of re-handshaking, which matters for the sub-millisecond ops
+            # this client is used for
+            self._pool = redis.ConnectionPool(
                 host=redis_host,
                 port=redis_port,
+                max_connections=50,
                 decode_responses=True,
                 socket_connect_timeout=5,
                 socket_timeout=5,
+                socket_keepalive=True,
             )
+            self._client = redis.Redis(connection_pool=self._pool)
 
             # Test connection
             self._client.ping()
@@ -66,25 +89,81 @@ class RedisClient:
                 redis_port,
                 e,
             )
-            self._available = False
-            self._client = None
+            self._mark_unavailable()
         except Exception as e:
             logger.error(
                 "Unexpected error connecting to Redis: %s. Using in-memory fallback.", e
             )
-            self._available = False
-            self._client = None
+            self._mark_unavailable()
+
+    @property
+    def connection(self) -> Optional[redis.Redis]:
+        """The underlying redis.Redis connection, or None when unavailable."""
+        return self._client if self._available else None
+
+    @property
+    def raw_connection(self) -> Optional[redis.Redis]:
+        """
+        A bytes-mode connection (no decode_responses), or None when
+        unavailable.
+
+        Consumers that store binary payloads — flask-session pickles its
+        session data — need this: the main client's decode_responses=True
+        would blow up trying to UTF-8-decode pickle bytes on read-back.
+        """
+        if not self._available:
+            return None
+        if self._raw_client is None:
+            self._raw_client = redis.Redis(
+                host=self.settings.REDIS_HOST,
+                port=self.settings.REDIS_PORT,
+                socket_connect_timeout=5,
+                socket_timeout=5,
+                socket_keepalive=True,
+            )
+        return self._raw_client
+
+    def _mark_unavailable(self):
+        """Trip the circuit breaker, doubling the re-probe backoff up to 60s."""
+        self._available = False
+        self._next_probe_at = time.monotonic() + self._probe_backoff
+        self._probe_backoff = min(self._probe_backoff * 2, 60.0)
 
     def is_available(self) -> bool:
         """
-        Check if Redis is available.
+        Check if Redis is available, re-probing after transient failures.
 
         Returns:
             bool: True if Redis connection is active, False otherwise
         """
+        if self._available:
+            return True
+        # Half-open probe: one ping per backoff window; success restores
+        # Redis traffic, failure pushes the next probe further out
+        if self._client and time.monotonic() >= self._next_probe_at:
+            try:
+                self._client.ping()
+                self._available = True
+                self._probe_backoff = 1.0
+                logger.info("Redis connection restored")
+            except Exception:
+                self._mark_unavailable()
         return self._available
 
-    def set_with_ttl(self, key: str, value: str, ttl_seconds: int = 300) -> bool:
+    def _evict_expired_fallback(self):
+        """Drop fallback entries whose TTL has passed (lazy, heap-driven)."""
+        now = time.monotonic()
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, key = heapq.heappop(self._expiry_heap)
+            entry = self._in_memory_fallback.get(key)
+            # The heap may hold stale entries for keys that were overwritten
+            # with a later expiry; only drop ones that are actually expired
+            if entry is not None and entry[1] <= now:
+                del self._in_memory_fallback[key]
+
+    def set_with_ttl(
+        self, key: str, value: str, ttl_seconds: int = 300, nx: bool = False
+    ) -> bool:
         """
         Store a key-value pair with TTL (time-to-live).
 
@@ -92,24 +171,34 @@ class RedisClient:
             key: The key to store
             value: The value to store
             ttl_seconds: Time-to-live in seconds (default: 300 = 5 minutes)
+            nx: Only set the key if it does not already exist
 
         Returns:
             bool: True if successful, False otherwise
         """
-        if self._available and self._client:
+        if self.is_available() and self._client:
             try:
+                if nx:
+                    # Atomic create-iff-absent, one round-trip
+                    return bool(self._client.set(key, value, nx=True, ex=ttl_seconds))
                 self._client.setex(key, ttl_seconds, value)
-                logger.debug("Stored key in Redis: %s (TTL: %ds)", key, ttl_seconds)
                 return True
             except Exception as e:
                 logger.error(
                     "Failed to store key in Redis: %s. Falling back to in-memory.", e
                 )
-                self._available = False
-
-        # Fallback to in-memory storage
-        self._in_memory_fallback[key] = value
-        logger.debug("Stored key in memory: %s", key)
+                self._mark_unavailable()
+
+        # Fallback to in-memory storage (TTL-expiring, LRU-capped)
+        self._evict_expired_fallback()
+        if nx and key in self._in_memory_fallback:
+            return False
+        expiry = time.monotonic() + ttl_seconds
+        self._in_memory_fallback[key] = (value, expiry)
+        self._in_memory_fallback.move_to_end(key)
+        heapq.heappush(self._expiry_heap, (expiry, key))
+        while len(self._in_memory_fallback) > _FALLBACK_MAX_KEYS:
+            self._in_memory_fallback.popitem(last=False)
         return True
 
     def get(self, key: str) -> Optional[str]:
@@ -122,23 +211,22 @@ class RedisClient:
         Returns:
             Optional[str]: The value if found, None otherwise
         """
-        if self._available and self._client:
+        if self.is_available() and self._client:
             try:
-                value = self._client.get(key)
-                logger.debug("Retrieved key from Redis: %s", key)
-                return value
+                return self._client.get(key)
             except Exception as e:
                 logger.error(
                     "Failed to retrieve key from Redis: %s. Checking in-memory fallback.",
                     e,
                 )
-                self._available = False
+                self._mark_unavailable()
 
         # Fallback to in-memory storage
-        value = self._in_memory_fallback.get(key)
-        if value:
-            logger.debug("Retrieved key from memory: %s", key)
-        return value
+        self._evict_expired_fallback()
+        entry = self._in_memory_fallback.get(key)
+        if entry is not None:
+            return entry[0]
+        return None
 
     def delete(self, key: str) -> bool:
         """
@@ -148,24 +236,23 @@ class RedisClient:
             key: The key to delete
 
         Returns:
-            bool: True if successful, False otherwise
+            bool: True if the key existed and was deleted, False otherwise
         """
-        if self._available and self._client:
+        if self.is_available() and self._client:
             try:
-                self._client.delete(key)
-                logger.debug("Deleted key from Redis: %s", key)
-                return True
+                return self._client.delete(key) > 0
             except Exception as e:
                 logger.error(
                     "Failed to delete key from Redis: %s. Falling back to in-memory.", e
                 )
-                self._available = False
+                self._mark_unavailable()
 
         # Fallback to in-memory storage
+        self._evict_expired_fallback()
         if key in self._in_memory_fallback:
             del self._in_memory_fallback[key]
-            logger.debug("Deleted key from memory: %s", key)
-        return True
+            return True
+        return False
 
     def exists(self, key: str) -> bool:
         """
@@ -177,28 +264,42 @@ class RedisClient:
         Returns:
             bool: True if key exists, False otherwise
         """
-        if self._available and self._client:
+        if self.is_available() and self._client:
             try:
-                exists = self._client.exists(key) > 0
-                logger.debug("Checked key existence in Redis: %s = %s", key, exists)
-                return exists
+                return self._client.exists(key) > 0
             except Exception as e:
                 logger.error(
                     "Failed to check key existence in Redis: %s. Checking in-memory fallback.",
                     e,
                 )
-                self._available = False
+                self._mark_unavailable()
 
         # Fallback to in-memory storage
-        exists = key in self._in_memory_fallback
-        logger.debug("Checked key existence in memory: %s = %s", key, exists)
-        return exists
+        self._evict_expired_fallback()
+        return key in self._in_memory_fallback
+
+    def pipeline(self):
+        """
+        Get a Redis pipeline for batching multiple commands into one
+        round-trip.
+
+        Returns:
+            A redis pipeline, or None when Redis is unavailable (callers
+            fall back to issuing individual operations)
+        """
+        if self._available and self._client:
+            return self._client.pipeline(transaction=False)
+        return None
 
     def close(self):
         """Close Redis connection."""
         if self._client:
             try:
                 self._client.close()
+                if self._raw_client:
+                    self._raw_client.close()
+                if self._pool:
+                    self._pool.disconnect()
                 logger.info("Redis connection closed")
             except Exception as e:
                 logger.error("Error closing Redis connection: %s", e)
@@ -206,6 +307,7 @@ class RedisClient:
 
 # Global Redis client instance
 _redis_client: Optional[RedisClient] = None
+_client_lock = threading.Lock()
 
 
 def get_redis_client() -> RedisClient:
@@ -216,6 +318,10 @@ def get_redis_client() -> RedisClient:
         RedisClient: The global Redis client instance
     """
     global _redis_client
+    # Double-checked locking: concurrent first calls (e.g. gthread workers
+    # warming up) must not each open their own connection pool
     if _redis_client is None:
-        _redis_client = RedisClient()
+        with _client_lock:
+            if _redis_client is None:
+                _redis_client = RedisClient()
     return _redis_client
@@ -0,0 +1,22 @@
+"""
+Canonical JSON serialization helpers.
+
+Schema payloads get serialized for storage and for cache keys; orjson with
+sorted keys is both the fastest option and gives a stable byte form, so the
+same dict always produces the same key material.
+"""
+
+import orjson
+
+
+def canonical(obj) -> bytes:
+    """
+    Serialize an object to canonical (sorted-key) JSON bytes.
+
+    Args:
+        obj: Any orjson-serializable object
+
+    Returns:
+        Canonical JSON as bytes
+    """
+    return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)